@@ -4,8 +4,11 @@ This module defines the CouplingElement class which will be used to represent th
 between two rotor shaft, which add mainly stiffness, mass and inertia to the system.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from plotly import graph_objects as go
+from scipy.sparse import coo_matrix
 
 from ross.shaft_element import ShaftElement
 from ross.units import Q_, check_units
@@ -108,6 +111,22 @@ class CouplingElement(ShaftElement):
     0.54925
     """
 
+    # The element matrices only depend on the parameters given at instantiation, so
+    # they are built once and cached. They are kept in slots instead of the instance
+    # __dict__, which is used by summary() and for equality comparisons.
+    # The element parameters are not slotted: the Rotor builds its dataframe from
+    # summary(), and instances have a __dict__ anyway since ShaftElement does not
+    # declare __slots__.
+    __slots__ = ("_M", "_K", "_C", "_G")
+
+    # sparsity pattern shared by the stiffness and damping matrices: each dof is
+    # connected to itself and to the same dof on the other station.
+    _KC_rows = np.tile(np.arange(12), 2)
+    _KC_cols = np.concatenate([np.arange(12), np.roll(np.arange(12), 6)])
+    # the gyroscopic matrix couples alpha and beta in each station
+    _G_rows = np.array([3, 4, 9, 10])
+    _G_cols = np.array([4, 3, 10, 9])
+
     @check_units
     def __init__(
         self,
@@ -149,8 +168,8 @@ class CouplingElement(ShaftElement):
         self.Ip_l = float(Ip_l)
         self.Ip_r = float(Ip_r)
         self.Ip = self.Ip_l + self.Ip_r
-        self.Id_l = float(Id_l) if Id_l else Ip_l / 2
-        self.Id_r = float(Id_r) if Id_r else Ip_r / 2
+        self.Id_l = float(Id_l) if Id_l else 0.5 * self.Ip_l
+        self.Id_r = float(Id_r) if Id_r else 0.5 * self.Ip_r
 
         self.kt_x = float(kt_x)
         self.kt_y = float(kt_y)
@@ -179,6 +198,34 @@ class CouplingElement(ShaftElement):
         self.Im = 1 / 8 * self.m * self.o_d**2
         self.slenderness_ratio = self.L / self.o_d
 
+        self._set_matrices()
+
+    def _set_matrices(self):
+        """Build and cache the mass, stiffness, damping and gyroscopic matrices."""
+        self._M = _build_matrix(
+            _build_M, self.m_l, self.Id_l, self.Ip_l, self.m_r, self.Id_r, self.Ip_r
+        )
+        self._K = _build_matrix(
+            _build_KC, self.kt_x, self.kt_y, self.kt_z, self.kr_x, self.kr_y, self.kr_z
+        )
+        self._C = _build_matrix(
+            _build_KC, self.ct_x, self.ct_y, self.ct_z, self.cr_x, self.cr_y, self.cr_z
+        )
+        self._G = _build_matrix(_build_G, self.Ip_l, self.Ip_r)
+
+    def __getstate__(self):
+        """Return the element parameters, without the cached matrices."""
+        return self.__dict__
+
+    def __setstate__(self, state):
+        """Restore the element parameters and the shared read-only matrices.
+
+        Used by pickle, copy and deepcopy, which would otherwise restore writeable
+        copies of the cached matrices, no longer shared with other elements.
+        """
+        self.__dict__.update(state)
+        self._set_matrices()
+
     def __repr__(self):
         """Return a string representation of a coupling element.
 
@@ -213,7 +260,7 @@ class CouplingElement(ShaftElement):
         Returns
         -------
         M : np.ndarray
-            A matrix of floats containing the values of the mass matrix.
+            A read-only matrix of floats containing the values of the mass matrix.
 
         Examples
         --------
@@ -232,39 +279,45 @@ class CouplingElement(ShaftElement):
                [ 0.     ,  0.     ,  0.     ,  0.     ,  0.54925,  0.     ],
                [ 0.     ,  0.     ,  0.     ,  0.     ,  0.     ,  1.0985 ]])
         """
-        m = self.m_l
-        Id = self.Id_l
-        Ip = self.Ip_l
-        # fmt: off
-        Ml = np.array([
-            [m,  0,  0,  0,  0,  0],
-            [0,  m,  0,  0,  0,  0],
-            [0,  0,  m,  0,  0,  0],
-            [0,  0,  0, Id,  0,  0],
-            [0,  0,  0,  0, Id,  0],
-            [0,  0,  0,  0,  0, Ip],
-        ])
-        # fmt: on
-
-        m = self.m_r
-        Id = self.Id_r
-        Ip = self.Ip_r
-        # fmt: off
-        Mr = np.array([
-            [m,  0,  0,  0,  0,  0],
-            [0,  m,  0,  0,  0,  0],
-            [0,  0,  m,  0,  0,  0],
-            [0,  0,  0, Id,  0,  0],
-            [0,  0,  0,  0, Id,  0],
-            [0,  0,  0,  0,  0, Ip],
-        ])
-        # fmt: on
-
-        M = np.zeros((12, 12))
-        M[:6, :6] = Ml
-        M[6:, 6:] = Mr
-
-        return M
+        return self._M
+
+    def M_diag(self):
+        """Diagonal of the mass matrix for an instance of a coupling element.
+
+        The mass matrix is diagonal, so this is all that is needed to assemble it
+        into a global matrix, e.g. with `M_global[dofs, dofs] += coupling.M_diag()`.
+
+        Returns
+        -------
+        M_diag : np.ndarray
+            Read-only array with the 12 diagonal entries of the mass matrix.
+
+        Examples
+        --------
+        >>> coupling = CouplingElement(m_l=10, m_r=20, Ip_l=1, Ip_r=2)
+        >>> coupling.M_diag()[6:]
+        array([20., 20., 20.,  1.,  1.,  2.])
+        """
+        return self.M().diagonal()
+
+    def M_sparse(self):
+        """Sparse mass matrix for an instance of a coupling element.
+
+        The mass matrix is diagonal, so only its 12 diagonal entries are stored.
+
+        Returns
+        -------
+        M : scipy.sparse.coo_matrix
+            Sparse mass matrix for the coupling element.
+
+        Examples
+        --------
+        >>> coupling = CouplingElement(m_l=10, m_r=20, Ip_l=1, Ip_r=2)
+        >>> coupling.M_sparse().data[:6]
+        array([10. , 10. , 10. ,  0.5,  0.5,  1. ])
+        """
+        dofs = np.arange(12)
+        return coo_matrix((self.M_diag(), (dofs, dofs)), shape=(12, 12))
 
     def K(self):
         """Stiffness matrix for an instance of a coupling element.
@@ -275,7 +328,8 @@ class CouplingElement(ShaftElement):
         Returns
         -------
         K : np.ndarray
-            A matrix of floats containing the values of the stiffness matrix.
+            A read-only matrix of floats containing the values of the stiffness
+            matrix.
 
         Examples
         --------
@@ -294,30 +348,33 @@ class CouplingElement(ShaftElement):
                [      0.,       0.,       0.,       0.,       0.,       0.],
                [      0.,       0.,       0.,       0.,       0., 3042560.]])
         """
-        k1 = self.kt_x
-        k2 = self.kt_y
-        k3 = self.kt_z
-        k4 = self.kr_x
-        k5 = self.kr_y
-        k6 = self.kr_z
-        # fmt: off
-        K = np.array([
-            [  k1,    0,    0,    0,    0,    0, -k1,    0,   0,    0,   0,    0],
-            [   0,   k2,    0,    0,    0,    0,   0,  -k2,   0,    0,   0,    0],
-            [   0,    0,   k3,    0,    0,    0,   0,    0, -k3,    0,   0,    0],
-            [   0,    0,    0,   k4,    0,    0,   0,    0,   0,  -k4,   0,    0],
-            [   0,    0,    0,    0,   k5,    0,   0,    0,   0,    0, -k5,    0],
-            [   0,    0,    0,    0,    0,   k6,   0,    0,   0,    0,   0,  -k6],
-            [ -k1,    0,    0,    0,    0,    0,  k1,    0,   0,    0,   0,    0],
-            [   0,  -k2,    0,    0,    0,    0,   0,   k2,   0,    0,   0,    0],
-            [   0,    0,  -k3,    0,    0,    0,   0,    0,  k3,    0,   0,    0],
-            [   0,    0,    0,  -k4,    0,    0,   0,    0,   0,   k4,   0,    0],
-            [   0,    0,    0,    0,  -k5,    0,   0,    0,   0,    0,  k5,    0],
-            [   0,    0,    0,    0,    0,  -k6,   0,    0,   0,    0,   0,   k6],
-        ])
-        # fmt: on
-
-        return K
+        return self._K
+
+    def K_sparse(self):
+        """Sparse stiffness matrix for an instance of a coupling element.
+
+        Only the 24 nonzero entries of the stiffness matrix are stored, which avoids
+        building a dense intermediate when assembling into a sparse global matrix.
+
+        Returns
+        -------
+        K : scipy.sparse.coo_matrix
+            Sparse stiffness matrix for the coupling element.
+
+        Examples
+        --------
+        >>> m = 151.55
+        >>> Ip = 2.197
+        >>> torsional_stiffness = 3.04256e6
+        >>> coupling = CouplingElement(
+        ...            m_l=m / 2, m_r=m / 2, Ip_l=Ip / 2, Ip_r=Ip / 2,
+        ...            kr_z=torsional_stiffness
+        ... )
+        >>> coupling.K_sparse().nnz
+        24
+        """
+        k = np.array([self.kt_x, self.kt_y, self.kt_z, self.kr_x, self.kr_y, self.kr_z])
+        return self._KC_sparse(k)
 
     def Kst(self):
         return np.zeros((12, 12))
@@ -331,7 +388,7 @@ class CouplingElement(ShaftElement):
         Returns
         -------
         C : np.ndarray
-            A matrix of floats containing the values of the damping matrix.
+            A read-only matrix of floats containing the values of the damping matrix.
 
         Examples
         --------
@@ -350,30 +407,65 @@ class CouplingElement(ShaftElement):
                [0., 0., 0., 0., 0., 0.],
                [0., 0., 0., 0., 0., 0.]])
         """
-        c1 = self.ct_x
-        c2 = self.ct_y
-        c3 = self.ct_z
-        c4 = self.cr_x
-        c5 = self.cr_y
-        c6 = self.cr_z
-        # fmt: off
-        C = np.array([
-            [  c1,    0,    0,    0,    0,    0, -c1,    0,   0,    0,   0,    0],
-            [   0,   c2,    0,    0,    0,    0,   0,  -c2,   0,    0,   0,    0],
-            [   0,    0,   c3,    0,    0,    0,   0,    0, -c3,    0,   0,    0],
-            [   0,    0,    0,   c4,    0,    0,   0,    0,   0,  -c4,   0,    0],
-            [   0,    0,    0,    0,   c5,    0,   0,    0,   0,    0, -c5,    0],
-            [   0,    0,    0,    0,    0,   c6,   0,    0,   0,    0,   0,  -c6],
-            [ -c1,    0,    0,    0,    0,    0,  c1,    0,   0,    0,   0,    0],
-            [   0,  -c2,    0,    0,    0,    0,   0,   c2,   0,    0,   0,    0],
-            [   0,    0,  -c3,    0,    0,    0,   0,    0,  c3,    0,   0,    0],
-            [   0,    0,    0,  -c4,    0,    0,   0,    0,   0,   c4,   0,    0],
-            [   0,    0,    0,    0,  -c5,    0,   0,    0,   0,    0,  c5,    0],
-            [   0,    0,    0,    0,    0,  -c6,   0,    0,   0,    0,   0,   c6],
-        ])
-        # fmt: on
-
-        return C
+        return self._C
+
+    def C_sparse(self):
+        """Sparse damping matrix for an instance of a coupling element.
+
+        Only the 24 nonzero entries of the damping matrix are stored, which avoids
+        building a dense intermediate when assembling into a sparse global matrix.
+
+        Returns
+        -------
+        C : scipy.sparse.coo_matrix
+            Sparse damping matrix for the coupling element.
+
+        Examples
+        --------
+        >>> coupling = CouplingElement(m_l=10, m_r=10, Ip_l=1, Ip_r=1, ct_x=1e3)
+        >>> coupling.C_sparse().toarray()[[0, 6], :][:, [0, 6]]
+        array([[ 1000., -1000.],
+               [-1000.,  1000.]])
+        """
+        c = np.array([self.ct_x, self.ct_y, self.ct_z, self.cr_x, self.cr_y, self.cr_z])
+        return self._KC_sparse(c)
+
+    @staticmethod
+    def _KC_data(values):
+        """Nonzero entries of the stiffness and damping matrices.
+
+        The entries are ordered according to the `_KC_rows` and `_KC_cols`
+        sparsity pattern, so they can be used to update an already assembled
+        matrix in place.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Coefficients for each of the 6 degrees of freedom of a station, with
+            shape (6,) or (n_elements, 6).
+
+        Returns
+        -------
+        data : np.ndarray
+            Array with shape (24,) or (n_elements, 24).
+        """
+        return np.concatenate([values, values, -values, -values], axis=-1)
+
+    def _KC_sparse(self, values):
+        """Build a sparse matrix with the stiffness and damping sparsity pattern.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Coefficients for each of the 6 degrees of freedom of a station.
+
+        Returns
+        -------
+        scipy.sparse.coo_matrix
+            A 12x12 sparse matrix.
+        """
+        data = self._KC_data(values)
+        return coo_matrix((data, (self._KC_rows, self._KC_cols)), shape=(12, 12))
 
     def G(self):
         """Gyroscopic matrix for an instance of a coupling element.
@@ -384,7 +476,7 @@ class CouplingElement(ShaftElement):
         Returns
         -------
         G: np.ndarray
-            Gyroscopic matrix for the coupling element.
+            Read-only gyroscopic matrix for the coupling element.
 
         Examples
         --------
@@ -403,35 +495,128 @@ class CouplingElement(ShaftElement):
                [ 0.    ,  0.    ,  0.    , -1.0985,  0.    ,  0.    ],
                [ 0.    ,  0.    ,  0.    ,  0.    ,  0.    ,  0.    ]])
         """
-        Ip = self.Ip_l
-        # fmt: off
-        Gl = np.array([
-            [0, 0, 0,   0,  0, 0],
-            [0, 0, 0,   0,  0, 0],
-            [0, 0, 0,   0,  0, 0],
-            [0, 0, 0,   0, Ip, 0],
-            [0, 0, 0, -Ip,  0, 0],
-            [0, 0, 0,   0,  0, 0],
-        ])
-        # fmt: on
-
-        Ip = self.Ip_r
-        # fmt: off
-        Gr = np.array([
-            [0, 0, 0,   0,  0, 0],
-            [0, 0, 0,   0,  0, 0],
-            [0, 0, 0,   0,  0, 0],
-            [0, 0, 0,   0, Ip, 0],
-            [0, 0, 0, -Ip,  0, 0],
-            [0, 0, 0,   0,  0, 0],
-        ])
-        # fmt: on
-
-        G = np.zeros((12, 12))
-        G[:6, :6] = Gl
-        G[6:, 6:] = Gr
-
-        return G
+        return self._G
+
+    def G_entries(self):
+        """Nonzero entries of the gyroscopic matrix for a coupling element.
+
+        Returns
+        -------
+        rows, cols : np.ndarray
+            Local row and column indexes of the 4 nonzero entries.
+        data : np.ndarray
+            Values of the nonzero entries.
+
+        Examples
+        --------
+        >>> coupling = CouplingElement(m_l=10, m_r=20, Ip_l=1, Ip_r=2)
+        >>> rows, cols, data = coupling.G_entries()
+        >>> rows, cols, data
+        (array([ 3,  4,  9, 10]), array([ 4,  3, 10,  9]), array([ 1., -1.,  2., -2.]))
+        """
+        return (
+            self._G_rows.copy(),
+            self._G_cols.copy(),
+            self.G()[self._G_rows, self._G_cols],
+        )
+
+    def G_sparse(self):
+        """Sparse gyroscopic matrix for an instance of a coupling element.
+
+        Only the 4 nonzero entries, which couple alpha and beta in each station, are
+        stored.
+
+        Returns
+        -------
+        G : scipy.sparse.coo_matrix
+            Sparse gyroscopic matrix for the coupling element.
+
+        Examples
+        --------
+        >>> coupling = CouplingElement(m_l=10, m_r=20, Ip_l=1, Ip_r=2)
+        >>> coupling.G_sparse().toarray()[3:5, 3:5]
+        array([[ 0.,  1.],
+               [-1.,  0.]])
+        """
+        rows, cols, data = self.G_entries()
+        return coo_matrix((data, (rows, cols)), shape=(12, 12))
+
+    @classmethod
+    def assemble_many(cls, elements, ndof):
+        """Assemble the matrices of several coupling elements at once.
+
+        The parameters of all elements are gathered into contiguous arrays so that
+        the nonzero entries of every element are computed in a single vectorized
+        pass, instead of calling each element's matrix methods in turn.
+
+        Parameters
+        ----------
+        elements : list
+            List of coupling elements. The elements need to be part of an assembled
+            rotor, since their global degrees of freedom are taken from
+            `dof_global_index`.
+        ndof : int
+            Number of degrees of freedom of the global matrices.
+
+        Returns
+        -------
+        M, K, C, G : scipy.sparse.coo_matrix
+            Global mass, stiffness, damping and gyroscopic matrices with the
+            contribution of the coupling elements.
+
+        Examples
+        --------
+        >>> import ross as rs
+        >>> steel = rs.materials.steel
+        >>> shaft = [rs.ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(2)]
+        >>> coupling = CouplingElement(m_l=1, m_r=1, Ip_l=0.1, Ip_r=0.1, kr_z=1e4)
+        >>> bearings = [rs.BearingElement(n, kxx=1e6, cxx=0) for n in (0, 3)]
+        >>> rotor = rs.Rotor([shaft[0], coupling, shaft[1]], bearing_elements=bearings)
+        >>> couplings = [
+        ...     elm for elm in rotor.shaft_elements if isinstance(elm, CouplingElement)
+        ... ]
+        >>> M, K, C, G = CouplingElement.assemble_many(couplings, rotor.ndof)
+        >>> K.shape
+        (24, 24)
+        """
+        n_elm = len(elements)
+
+        def gather(attr):
+            return np.fromiter((getattr(elm, attr) for elm in elements), float, n_elm)
+
+        dofs = np.array(
+            [list(elm.dof_global_index.values()) for elm in elements], dtype=int
+        ).reshape(n_elm, 12)
+
+        m_l, m_r = gather("m_l"), gather("m_r")
+        Id_l, Id_r = gather("Id_l"), gather("Id_r")
+        Ip_l, Ip_r = gather("Ip_l"), gather("Ip_r")
+        k = np.column_stack(
+            [gather(attr) for attr in ("kt_x", "kt_y", "kt_z", "kr_x", "kr_y", "kr_z")]
+        )
+        c = np.column_stack(
+            [gather(attr) for attr in ("ct_x", "ct_y", "ct_z", "cr_x", "cr_y", "cr_z")]
+        )
+
+        M_data = np.column_stack(
+            [m_l, m_l, m_l, Id_l, Id_l, Ip_l, m_r, m_r, m_r, Id_r, Id_r, Ip_r]
+        )
+        K_data = cls._KC_data(k)
+        C_data = cls._KC_data(c)
+        G_data = np.column_stack([Ip_l, -Ip_l, Ip_r, -Ip_r])
+
+        KC_rows = dofs[:, cls._KC_rows].ravel()
+        KC_cols = dofs[:, cls._KC_cols].ravel()
+        G_rows = dofs[:, cls._G_rows].ravel()
+        G_cols = dofs[:, cls._G_cols].ravel()
+
+        shape = (ndof, ndof)
+        M = coo_matrix((M_data.ravel(), (dofs.ravel(), dofs.ravel())), shape=shape)
+        K = coo_matrix((K_data.ravel(), (KC_rows, KC_cols)), shape=shape)
+        C = coo_matrix((C_data.ravel(), (KC_rows, KC_cols)), shape=shape)
+        G = coo_matrix((G_data.ravel(), (G_rows, G_cols)), shape=shape)
+
+        return M, K, C, G
 
     def _patch(self, position, check_sld, fig, units):
         """Coupling element patch.
@@ -456,62 +641,305 @@ class CouplingElement(ShaftElement):
         fig : plotly.graph_objects.Figure
             The figure object which traces are added on.
         """
-        zpos = position
-        ypos = 0
-        L = self.L
-        scale = self.scale_factor * 0.3
-
-        # plot the coupling
-        z_upper = [zpos, zpos, zpos + L, zpos + L, zpos]
-        y_upper = [ypos, ypos + scale, ypos + scale, ypos, ypos]
-        z_lower = [zpos, zpos, zpos + L, zpos + L, zpos]
-        y_lower = [ypos, ypos - scale, ypos - scale, ypos, ypos]
-
-        z_pos = z_upper
-        z_pos.extend(z_lower)
-
-        y_pos = y_upper
-        y_pos.extend(y_lower)
-
-        name = (
-            f"{self.tag}<br>(<i>CouplingElement</i>)"
-            if "ShaftElement" in self.tag
-            else self.tag
-        )
-
-        legend = "Coupling"
-
-        customdata = [
-            self.n,
-            self.m,
-            self.Ip,
-        ]
-
-        hovertemplate = (
-            f"Element Number: {customdata[0]}<br>"
-            + f"Mass: {customdata[1]:.3f} kg<br>"
-            + f"Polar moment of inertia: {customdata[2]:.3f} kg⋅m²<br>"
+        z_pos, y_pos = _coupling_outline(position, self.L, self.scale_factor)
+        x_out = _to_length_units(z_pos, units)
+        y_out = _to_length_units(y_pos, units)
+
+        customdata = [self.n, self.m, self.Ip, self._patch_name()]
+        # text displayed when hovering over the fill
+        text = (
+            f"Element Number: {self.n}<br>"
+            + f"Mass: {self.m:.3f} kg<br>"
+            + f"Polar moment of inertia: {self.Ip:.3f} kg⋅m²<br>"
         )
 
         fig.add_trace(
-            go.Scatter(
-                x=Q_(z_pos, "m").to(units).m,
-                y=Q_(y_pos, "m").to(units).m,
+            _coupling_scatter(
+                x_out,
+                y_out,
                 customdata=[customdata] * len(z_pos),
-                text=hovertemplate,
-                mode="lines",
-                opacity=0.5,
-                fill="toself",
-                fillcolor=self.color,
-                line=dict(width=1.5, color="black", dash="dash"),
-                showlegend=False,
-                name=name,
-                legendgroup=legend,
+                color=self.color,
+                name=customdata[3],
+                text=text,
                 hoveron="points+fills",
-                hoverinfo="text",
-                hovertemplate=hovertemplate,
-                hoverlabel=dict(bgcolor=self.color),
             )
         )
 
         return fig
+
+    def _patch_name(self):
+        """Name displayed for the coupling element in the rotor plot."""
+        if "ShaftElement" in self.tag:
+            return f"{self.tag}<br>(<i>CouplingElement</i>)"
+        return self.tag
+
+    @classmethod
+    def batch_patch(cls, elements, positions, fig, units="m"):
+        """Coupling elements patch drawn with a single trace.
+
+        Patch that will be used to draw several coupling elements using Plotly
+        library. Instead of one trace per element, the drawings of all elements with
+        the same color are concatenated in a single trace, with gaps between them.
+        Element data is attached to each point of the outline, so it is displayed
+        when hovering over the points of each element.
+
+        Parameters
+        ----------
+        elements : list
+            List of coupling elements.
+        positions : list
+            Positions in which the patches will be drawn.
+        fig : plotly.graph_objects.Figure
+            The figure object which traces are added on.
+        units : str, optional
+            Element length units.
+            Default is 'm'.
+
+        Returns
+        -------
+        fig : plotly.graph_objects.Figure
+            The figure object which traces are added on.
+
+        Examples
+        --------
+        >>> couplings = [
+        ...     CouplingElement(m_l=10, m_r=10, Ip_l=1, Ip_r=1, n=n, tag=f"Coupling {n}")
+        ...     for n in range(3)
+        ... ]
+        >>> fig = CouplingElement.batch_patch(couplings, [0, 0.3, 0.6], go.Figure())
+        >>> len(fig.data)
+        1
+        """
+        colors = {elm.color: [] for elm in elements}
+        for elm, position in zip(elements, positions):
+            colors[elm.color].append((elm, position))
+
+        for color, elements_positions in colors.items():
+            z_pos = []
+            y_pos = []
+            customdata = []
+            names = []
+            for elm, position in elements_positions:
+                z_elm, y_elm = _coupling_outline(position, elm.L, elm.scale_factor)
+                # add a gap after each element
+                z_pos.extend([z_elm, [np.nan]])
+                y_pos.extend([y_elm, [np.nan]])
+                customdata.extend(
+                    [[elm.n, elm.m, elm.Ip, elm._patch_name()]] * (len(z_elm) + 1)
+                )
+                names.append(elm.tag)
+
+            fig.add_trace(
+                _coupling_scatter(
+                    _to_length_units(np.concatenate(z_pos), units),
+                    _to_length_units(np.concatenate(y_pos), units),
+                    customdata=customdata,
+                    color=color,
+                    name=", ".join(str(name) for name in names),
+                    hoveron="points",
+                )
+            )
+
+        return fig
+
+
+@lru_cache(maxsize=1024)
+def _build_matrix(builder, *parameters):
+    """Build a read-only coupling element matrix.
+
+    Matrices are memoized on the builder and its parameters, so coupling elements
+    with the same parameters share the same array. Since the array is shared, it is
+    made read-only.
+
+    Parameters
+    ----------
+    builder : callable
+        One of the _build_M, _build_KC or _build_G functions.
+    *parameters : float
+        Parameters passed to the builder.
+
+    Returns
+    -------
+    matrix : np.ndarray
+        A read-only 12x12 matrix of floats.
+    """
+    matrix = builder(*parameters)
+    matrix.setflags(write=False)
+
+    return matrix
+
+
+def _build_M(m_l, Id_l, Ip_l, m_r, Id_r, Ip_r):
+    """Build the mass matrix for a coupling element.
+
+    Parameters
+    ----------
+    m_l, m_r : float
+        Mass of the left and right stations.
+    Id_l, Id_r : float
+        Diametral moment of inertia of the left and right stations.
+    Ip_l, Ip_r : float
+        Polar moment of inertia of the left and right stations.
+
+    Returns
+    -------
+    M : np.ndarray
+        A 12x12 matrix of floats.
+
+    Examples
+    --------
+    >>> _build_M(1.0, 0.1, 0.2, 3.0, 0.3, 0.6).diagonal()
+    array([1. , 1. , 1. , 0.1, 0.1, 0.2, 3. , 3. , 3. , 0.3, 0.3, 0.6])
+    """
+    M = np.zeros((12, 12))
+    M[0, 0] = M[1, 1] = M[2, 2] = m_l
+    M[3, 3] = M[4, 4] = Id_l
+    M[5, 5] = Ip_l
+    M[6, 6] = M[7, 7] = M[8, 8] = m_r
+    M[9, 9] = M[10, 10] = Id_r
+    M[11, 11] = Ip_r
+
+    return M
+
+
+# connectivity between the left and right stations for each degree of freedom
+_STATIONS_CONNECTIVITY = np.array([[1.0, -1.0], [-1.0, 1.0]])
+
+
+def _build_KC(v1, v2, v3, v4, v5, v6):
+    """Build a stiffness or damping matrix for a coupling element.
+
+    Each degree of freedom is connected to the same degree of freedom on the
+    other station, with coefficients given for x, y, z, alpha, beta and theta.
+    The matrix is therefore the Kronecker product of the stations connectivity
+    [[1, -1], [-1, 1]] and the diagonal matrix of coefficients.
+
+    Parameters
+    ----------
+    v1, v2, v3, v4, v5, v6 : float
+        Coefficients for each degree of freedom of a station.
+
+    Returns
+    -------
+    KC : np.ndarray
+        A 12x12 matrix of floats.
+
+    Examples
+    --------
+    >>> _build_KC(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)[[0, 6], :][:, [0, 6]]
+    array([[ 1., -1.],
+           [-1.,  1.]])
+    """
+    values = np.diag(np.array([v1, v2, v3, v4, v5, v6]))
+    return np.kron(_STATIONS_CONNECTIVITY, values)
+
+
+def _build_G(Ip_l, Ip_r):
+    """Build the gyroscopic matrix for a coupling element.
+
+    Parameters
+    ----------
+    Ip_l, Ip_r : float
+        Polar moment of inertia of the left and right stations.
+
+    Returns
+    -------
+    G : np.ndarray
+        A 12x12 matrix of floats.
+
+    Examples
+    --------
+    >>> _build_G(0.2, 0.6)[3:5, 3:5]
+    array([[ 0. ,  0.2],
+           [-0.2,  0. ]])
+    """
+    G = np.zeros((12, 12))
+    G[3, 4] = Ip_l
+    G[4, 3] = -Ip_l
+    G[9, 10] = Ip_r
+    G[10, 9] = -Ip_r
+
+    return G
+
+
+def _coupling_outline(position, L, scale_factor):
+    """Coordinates of the coupling drawing, in meters.
+
+    The coupling is drawn as two rectangles, above and below the shaft centerline.
+
+    Parameters
+    ----------
+    position : float
+        Axial position of the left end of the coupling.
+    L : float
+        Element length.
+    scale_factor : float
+        Scale factor applied to the height of the drawing.
+
+    Returns
+    -------
+    z_pos, y_pos : np.ndarray
+        Axial and radial coordinates of the outline.
+    """
+    scale = scale_factor * 0.3
+    z_pos = np.array([position, position, position + L, position + L, position] * 2)
+    y_pos = np.array([0, scale, scale, 0, 0, 0, -scale, -scale, 0, 0])
+
+    return z_pos, y_pos
+
+
+def _to_length_units(values, units):
+    """Convert lengths in meters to the given units.
+
+    Meters are the default units, so in that case the values are returned without
+    going through pint.
+    """
+    if units == "m":
+        return np.asarray(values)
+    return Q_(values, "m").to(units).m
+
+
+def _coupling_scatter(x, y, customdata, color, name, **kwargs):
+    """Plotly trace with the style used to draw coupling elements.
+
+    Parameters
+    ----------
+    x, y : np.ndarray
+        Coordinates of the outline.
+    customdata : list
+        Element number, mass, polar moment of inertia and name for each point.
+    color : str
+        Fill color.
+    name : str
+        Trace name.
+    **kwargs : optional
+        Additional arguments passed to plotly.graph_objects.Scatter.
+
+    Returns
+    -------
+    plotly.graph_objects.Scatter
+    """
+    hovertemplate = (
+        "%{customdata[3]}<br>"
+        + "Element Number: %{customdata[0]}<br>"
+        + "Mass: %{customdata[1]:.3f} kg<br>"
+        + "Polar moment of inertia: %{customdata[2]:.3f} kg⋅m²<br>"
+        + "<extra></extra>"
+    )
+
+    return go.Scatter(
+        x=x,
+        y=y,
+        customdata=customdata,
+        mode="lines",
+        opacity=0.5,
+        fill="toself",
+        fillcolor=color,
+        line=dict(width=1.5, color="black", dash="dash"),
+        showlegend=False,
+        name=name,
+        legendgroup="Coupling",
+        hovertemplate=hovertemplate,
+        hoverlabel=dict(bgcolor=color),
+        **kwargs,
+    )
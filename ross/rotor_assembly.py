@@ -1047,12 +1047,26 @@ class Rotor(object):
 
         for elm in self.elements:
             dofs = list(elm.dof_global_index.values())
+
+            # coupling mass matrices are diagonal, so only the diagonal is assembled
+            # (unless a subclass overrides M())
+            if (
+                isinstance(elm, CouplingElement)
+                and type(elm).M is CouplingElement.M
+                and not synchronous
+            ):
+                M0[dofs, dofs] += elm.M_diag()
+                continue
+
             try:
                 M = elm.M(frequency)
             except TypeError:
                 M = elm.M()
 
             if synchronous:
+                # element matrices can be read-only (e.g. CouplingElement caches them)
+                if not M.flags.writeable:
+                    M = M.copy()
                 if elm in self.shaft_elements:
                     a0 = elm.dof_mapping()["alpha_0"]
                     b0 = elm.dof_mapping()["beta_0"]
@@ -2428,10 +2442,23 @@ class Rotor(object):
         )
 
         # plot shaft elements
+        couplings = []
         for sh_elm in self.shaft_elements:
+            # couplings are drawn in a batch, unless their class customizes _patch
+            if (
+                isinstance(sh_elm, CouplingElement)
+                and type(sh_elm)._patch is CouplingElement._patch
+            ):
+                couplings.append(sh_elm)
+                continue
             position = self.nodes_pos[sh_elm.n]
             fig = sh_elm._patch(position, check_sld, fig, length_units)
 
+        # plot coupling elements in a single batch
+        if couplings:
+            positions = [self.nodes_pos[coupling.n] for coupling in couplings]
+            fig = CouplingElement.batch_patch(couplings, positions, fig, length_units)
+
         mean_od = np.mean(nodes_o_d)
         # plot disk elements
 
@@ -0,0 +1,297 @@
+import pickle
+from copy import copy, deepcopy
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from plotly import graph_objects as go
+
+from ross.bearing_seal_element import BearingElement
+from ross.coupling_element import CouplingElement
+from ross.materials import steel
+from ross.rotor_assembly import Rotor
+from ross.shaft_element import ShaftElement
+from ross.units import Q_
+
+
+@pytest.fixture
+def coupling():
+    return CouplingElement(
+        m_l=1.0,
+        m_r=2.0,
+        Ip_l=0.3,
+        Ip_r=0.4,
+        Id_l=0.1,
+        kt_x=1e6,
+        kt_y=2e6,
+        kt_z=3e6,
+        kr_x=4e3,
+        kr_y=5e3,
+        kr_z=6e3,
+        ct_x=1.0,
+        ct_y=2.0,
+        ct_z=3.0,
+        cr_x=4.0,
+        cr_y=5.0,
+        cr_z=6.0,
+        n=0,
+        tag="coupling",
+    )
+
+
+def test_mass_matrix(coupling):
+    M0 = np.diag([1.0, 1.0, 1.0, 0.1, 0.1, 0.3, 2.0, 2.0, 2.0, 0.2, 0.2, 0.4])
+
+    assert_allclose(coupling.M(), M0)
+
+
+def test_stiffness_matrix(coupling):
+    k = np.diag([1e6, 2e6, 3e6, 4e3, 5e3, 6e3])
+    K0 = np.block([[k, -k], [-k, k]])
+
+    assert_allclose(coupling.K(), K0)
+
+
+def test_damping_matrix(coupling):
+    c = np.diag([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    C0 = np.block([[c, -c], [-c, c]])
+
+    assert_allclose(coupling.C(), C0)
+
+
+def test_gyroscopic_matrix(coupling):
+    G0 = np.zeros((12, 12))
+    G0[3, 4], G0[4, 3] = 0.3, -0.3
+    G0[9, 10], G0[10, 9] = 0.4, -0.4
+
+    assert_allclose(coupling.G(), G0)
+
+
+def test_cached_matrices(coupling):
+    M = coupling.M()
+
+    assert M is coupling.M()
+    assert not M.flags.writeable
+    with pytest.raises(ValueError):
+        M[0, 0] = 100.0
+    assert "_M" not in coupling.summary()
+
+
+def test_shared_matrices(coupling):
+    other = CouplingElement(
+        m_l=1.0,
+        m_r=2.0,
+        Ip_l=0.3,
+        Ip_r=0.4,
+        Id_l=0.1,
+        kt_x=1e6,
+        kt_y=2e6,
+        kt_z=3e6,
+        kr_x=4e3,
+        kr_y=5e3,
+        kr_z=6e3,
+        n=1,
+        tag="other coupling",
+    )
+
+    assert other.M() is coupling.M()
+    assert other.K() is coupling.K()
+    assert other.G() is coupling.G()
+    assert other.C() is not coupling.C()
+
+
+def test_summary(coupling):
+    summary = coupling.summary()
+
+    for attr in ("n_l", "n_r", "m", "Ip", "kt_x", "L", "o_d", "beam_cg"):
+        assert attr in summary
+    for attr in CouplingElement.__slots__:
+        assert attr not in summary
+
+
+def test_pickle(coupling):
+    coupling_pickled = pickle.loads(pickle.dumps(coupling))
+    assert coupling == coupling_pickled
+    assert_allclose(coupling.K(), coupling_pickled.K())
+    assert not coupling_pickled.K().flags.writeable
+    assert coupling_pickled.K() is coupling.K()
+
+
+def test_copy(coupling):
+    for coupling_copy in (copy(coupling), deepcopy(coupling)):
+        assert coupling == coupling_copy
+        assert coupling_copy.M() is coupling.M()
+        assert not coupling_copy.M().flags.writeable
+
+
+def test_stiffness_damping_sparsity_pattern(coupling):
+    rows, cols = CouplingElement._KC_rows, CouplingElement._KC_cols
+    k = np.array([1e6, 2e6, 3e6, 4e3, 5e3, 6e3])
+    c = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    for matrix, values in ((coupling.K(), k), (coupling.C(), c)):
+        assert_allclose(matrix[rows, cols], CouplingElement._KC_data(values))
+        assert np.count_nonzero(matrix) == len(rows)
+
+
+def test_sparse_matrices(coupling):
+    assert coupling.K_sparse().nnz == 24
+    assert_allclose(coupling.K_sparse().toarray(), coupling.K())
+    assert_allclose(coupling.C_sparse().toarray(), coupling.C())
+    assert_allclose(coupling.M_sparse().toarray(), coupling.M())
+    assert_allclose(coupling.G_sparse().toarray(), coupling.G())
+
+
+@pytest.fixture
+def rotor_with_couplings():
+    shaft = [ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(3)]
+    couplings = [
+        CouplingElement(m_l=1, m_r=2, Ip_l=0.1, Ip_r=0.2, kt_x=1e6, cr_z=10),
+        CouplingElement(m_l=3, m_r=4, Ip_l=0.3, Ip_r=0.4, kt_y=2e6, kr_z=1e4),
+    ]
+    bearings = [BearingElement(n, kxx=1e6, cxx=0) for n in (0, 5)]
+
+    return Rotor(
+        [shaft[0], couplings[0], shaft[1], couplings[1], shaft[2]],
+        bearing_elements=bearings,
+    )
+
+
+def test_rotor_synchronous_mass_matrix(rotor_with_couplings):
+    coupling = rotor_with_couplings.shaft_elements[1]
+    M0 = coupling.M().copy()
+
+    rotor_with_couplings.M(0, synchronous=True)
+
+    assert_allclose(coupling.M(), M0)
+
+
+def test_mass_diagonal_and_gyroscopic_entries(coupling):
+    assert_allclose(np.diag(coupling.M_diag()), coupling.M())
+
+    rows, cols, data = coupling.G_entries()
+    G = np.zeros((12, 12))
+    G[rows, cols] = data
+    assert_allclose(G, coupling.G())
+
+
+def test_rotor_mass_matrix(rotor_with_couplings):
+    rotor = rotor_with_couplings
+    M = np.zeros((rotor.ndof, rotor.ndof))
+    for elm in rotor.elements:
+        dofs = list(elm.dof_global_index.values())
+        try:
+            M[np.ix_(dofs, dofs)] += elm.M(0)
+        except TypeError:
+            M[np.ix_(dofs, dofs)] += elm.M()
+
+    assert_allclose(rotor.M(0), M)
+
+
+def test_rotor_mass_matrix_overridden_coupling_mass():
+    class HeavyCoupling(CouplingElement):
+        def M(self):
+            return 2 * super().M()
+
+    def rotor(coupling_class):
+        shaft = [ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(2)]
+        coupling = coupling_class(m_l=1, m_r=1, Ip_l=0.1, Ip_r=0.1)
+        bearings = [BearingElement(n, kxx=1e6, cxx=0) for n in (0, 3)]
+        return Rotor([shaft[0], coupling, shaft[1]], bearing_elements=bearings)
+
+    heavy_rotor = rotor(HeavyCoupling)
+    coupling = heavy_rotor.shaft_elements[1]
+    assert_allclose(coupling.M_diag(), np.diag(coupling.M()))
+
+    for synchronous in (False, True):
+        M_heavy = heavy_rotor.M(0, synchronous=synchronous)
+        M_base = rotor(CouplingElement).M(0, synchronous=synchronous)
+        assert_allclose(M_heavy[6:18, 6:18] - M_base[6:18, 6:18], coupling.M() / 2)
+
+
+def test_assemble_many(rotor_with_couplings):
+    rotor = rotor_with_couplings
+    couplings = [
+        elm for elm in rotor.shaft_elements if isinstance(elm, CouplingElement)
+    ]
+
+    M, K, C, G = CouplingElement.assemble_many(couplings, rotor.ndof)
+
+    for matrix, assembled in zip("MKCG", (M, K, C, G)):
+        expected = np.zeros((rotor.ndof, rotor.ndof))
+        for elm in couplings:
+            dofs = list(elm.dof_global_index.values())
+            expected[np.ix_(dofs, dofs)] += getattr(elm, matrix)()
+        assert_allclose(assembled.toarray(), expected)
+
+
+def test_plot_rotor_couplings_single_trace(rotor_with_couplings):
+    fig = rotor_with_couplings.plot_rotor()
+    coupling_traces = [data for data in fig.data if data.legendgroup == "Coupling"]
+
+    assert len(coupling_traces) == 1
+    trace = coupling_traces[0]
+    # 10 points for each coupling drawing plus a gap after each of them
+    assert len(trace.x) == 22
+    assert trace.name == "ShaftElement 1, ShaftElement 3"
+    assert trace.hoveron == "points"
+    assert "%{customdata[0]}" in trace.hovertemplate
+    assert "%{customdata[1]:.3f} kg" in trace.hovertemplate
+
+    couplings = rotor_with_couplings.shaft_elements[1::2]
+    for i, coupling in enumerate(couplings):
+        for n, m, Ip, name in trace.customdata[11 * i : 11 * (i + 1)]:
+            assert (n, m, Ip) == (coupling.n, coupling.m, coupling.Ip)
+            assert name == f"{coupling.tag}<br>(<i>CouplingElement</i>)"
+
+
+def test_plot_rotor_custom_coupling_patch():
+    class CustomCoupling(CouplingElement):
+        def _patch(self, position, check_sld, fig, units):
+            fig.add_trace(go.Scatter(x=[position], y=[0], name="custom"))
+            return fig
+
+    shaft = [ShaftElement(0.25, 0, 0.05, material=steel) for _ in range(2)]
+    coupling = CustomCoupling(m_l=1, m_r=1, Ip_l=0.1, Ip_r=0.1)
+    bearings = [BearingElement(n, kxx=1e6, cxx=0) for n in (0, 3)]
+    rotor = Rotor([shaft[0], coupling, shaft[1]], bearing_elements=bearings)
+
+    fig = rotor.plot_rotor()
+
+    assert [data.name for data in fig.data].count("custom") == 1
+    assert not [data for data in fig.data if data.legendgroup == "Coupling"]
+
+
+def test_patch_units(coupling):
+    fig_m = coupling._patch(0.5, False, go.Figure(), "m")
+    fig_mm = coupling._patch(0.5, False, go.Figure(), "mm")
+
+    assert_allclose(fig_m.data[0].x[:4], [0.5, 0.5, 0.8, 0.8])
+    assert_allclose(fig_mm.data[0].x, 1000 * np.array(fig_m.data[0].x))
+    assert_allclose(fig_mm.data[0].y, 1000 * np.array(fig_m.data[0].y))
+
+
+def test_patch_style(coupling):
+    patch = coupling._patch(0, False, go.Figure(), "m").data[0]
+    batch = CouplingElement.batch_patch([coupling], [0], go.Figure()).data[0]
+
+    for attr in (
+        "opacity",
+        "fill",
+        "fillcolor",
+        "line",
+        "legendgroup",
+        "hovertemplate",
+    ):
+        assert patch[attr] == batch[attr]
+    assert patch.hoveron == "points+fills"
+    assert patch.customdata[0] == batch.customdata[0]
+
+
+def test_default_diametral_inertia():
+    coupling = CouplingElement(m_l=1, m_r=1, Ip_l=np.float32(3), Ip_r=Q_(4, "kg*m**2"))
+
+    assert type(coupling.Id_l) is float
+    assert type(coupling.Id_r) is float
+    assert coupling.Id_l == 1.5
+    assert coupling.Id_r == 2.0
@@ -225,3 +225,22 @@ def test_unit_Q_conversion(auxiliary_function):
     results_dict = {k: v for k, v in zip(arguments.keys(), results)}
     for arg, actual in results_dict.items():
         assert_allclose(actual, arguments[arg].expected_converted_value)
+
+
+def test_units_plain_numbers(monkeypatch):
+    @check_units
+    def func(L, m=None, speed=None, frequency=None):
+        return L, m, speed, frequency
+
+    speed = Q_(60, "RPM")
+
+    def raise_error(*args, **kwargs):
+        raise AssertionError("plain numbers should not be converted with pint")
+
+    monkeypatch.setattr("ross.units.Q_", raise_error)
+    L, m, speed, frequency = func(1.5, m=2, speed=speed)
+
+    assert L == 1.5
+    assert m == 2
+    assert frequency is None
+    assert_allclose(speed, 6.283185307179586)
@@ -3,6 +3,7 @@
 import inspect
 import warnings
 from functools import wraps
+from numbers import Number
 from pathlib import Path
 
 import pint
@@ -122,14 +123,21 @@ def check_units(func):
     converted to the default:
     >>> foo(L=Q_(0.5, 'inches'))
     0.0127
+
+    Plain numbers are assumed to be given in the default unit already, so they are
+    passed to the function without going through pint.
     """
+    args_names = inspect.getfullargspec(func)[0]
 
     @wraps(func)
     def inner(*args, **kwargs):
         base_unit_args = []
-        args_names = inspect.getfullargspec(func)[0]
 
         for arg_name, arg_value in zip(args_names, args):
+            if arg_value is None or isinstance(arg_value, Number):
+                base_unit_args.append(arg_value)
+                continue
+
             names = arg_name.split("_")
             if "units" in names:
                 base_unit_args.append(arg_value)
@@ -163,6 +171,10 @@ def check_units(func):
 
         base_unit_kwargs = {}
         for k, v in kwargs.items():
+            if v is None or isinstance(v, Number):
+                base_unit_kwargs[k] = v
+                continue
+
             names = k.split("_")
             if "units" in names:
                 base_unit_kwargs[k] = v